@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
+import asyncio
+import atexit
+import functools
 import subprocess
 import time
 import datetime as dt
 import os
 import sys
 import json
+import random
 import signal
 import re
 import platform
+import shutil
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -17,21 +22,61 @@ except Exception as e:
 	print("PyYAML not installed. Please add 'PyYAML' to requirements and install.", file=sys.stderr)
 	yaml = None
 
+# orjson encodes log lines several times faster than stdlib json; it is
+# optional and we fall back silently when it is not installed. Both
+# variants produce the UTF-8 bytes that log() writes to its fd.
+try:
+	import orjson
+
+	def _dumps(obj: dict) -> bytes:
+		return orjson.dumps(obj)
+except Exception:
+	def _dumps(obj: dict) -> bytes:
+		return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 # Platform detection
 IS_WINDOWS = platform.system() == "Windows"
 IS_MACOS = platform.system() == "Darwin"
 
+# On Windows, detect the console codepage once at import so run_cmd can
+# decode child output without re-spawning the process per candidate encoding.
+_WIN_ENCODING = None
+if IS_WINDOWS:
+	try:
+		import ctypes
+		_WIN_ENCODING = f"cp{ctypes.windll.kernel32.GetConsoleOutputCP()}"
+	except Exception:
+		import locale
+		_WIN_ENCODING = locale.getpreferredencoding(False)
+
+
+def _decode_output(raw: bytes) -> str:
+	if not raw:
+		return ""
+	for encoding in (_WIN_ENCODING, "utf-8", "latin1"):
+		if not encoding:
+			continue
+		try:
+			return raw.decode(encoding)
+		except (UnicodeDecodeError, LookupError):
+			continue
+	return raw.decode("utf-8", errors="replace")
+
+# Home directory resolved once; expanduser consults env vars (and the
+# registry on Windows) every call, so all user-relative paths build on this.
+_HOME = Path.home()
+
 # Platform-specific paths
 if IS_WINDOWS:
 	APP_ROOT = Path(__file__).parent.resolve()
 	CONFIG_PATH = APP_ROOT / "config.yaml"
-	LOG_PATH = Path.home() / "AppData/Local/claude-scheduler.log"
+	LOG_PATH = _HOME / "AppData/Local/claude-scheduler.log"
 else:
 	# Avoid hardcoded user-specific paths. Allow override via environment
 	# variable CLAUDE_SCHEDULER_ROOT, otherwise use the script directory.
 	APP_ROOT = Path(os.environ.get("CLAUDE_SCHEDULER_ROOT", Path(__file__).parent)).resolve()
 	CONFIG_PATH = APP_ROOT / "config.yaml"
-	LOG_PATH = Path.home() / "Library/Logs/claude-scheduler.log"
+	LOG_PATH = _HOME / "Library/Logs/claude-scheduler.log"
 
 DEFAULT_CONFIG = {
 	"timezone": "Europe/London",
@@ -55,26 +100,86 @@ WEEKDAY_MAP = {
 }
 
 
+# Log fd opened lazily once and kept for the daemon's lifetime. Writing
+# whole lines with os.write skips the text-layer encoding and buffer
+# management, and each small append is atomic on POSIX, which keeps
+# entries intact under external log rotation.
+_LOG_FD = None
+
+
+def _close_log() -> None:
+	global _LOG_FD
+	if _LOG_FD is not None:
+		os.close(_LOG_FD)
+		_LOG_FD = None
+
+
+def _get_log_fd() -> int:
+	global _LOG_FD
+	if _LOG_FD is None:
+		LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+		_LOG_FD = os.open(str(LOG_PATH), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+		atexit.register(_close_log)
+	return _LOG_FD
+
+
+# Rotate the log once it passes ~10MB so it cannot grow unboundedly over
+# months of daemon runtime. The size check runs only every 1024 writes,
+# keeping the amortized cost near zero.
+_LOG_MAX_BYTES = 10 * 1024 * 1024
+_LOG_CHECK_EVERY = 1024
+_log_writes = 0
+
+
+def _maybe_rotate_log() -> None:
+	global _log_writes
+	_log_writes += 1
+	if _log_writes % _LOG_CHECK_EVERY:
+		return
+	try:
+		if os.fstat(_LOG_FD).st_size > _LOG_MAX_BYTES:
+			_close_log()
+			os.replace(LOG_PATH, LOG_PATH.with_suffix(".log.1"))
+	except OSError:
+		pass
+
+
 def log(message: str, data: dict | None = None) -> None:
-	LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 	ts = dt.datetime.now().isoformat(timespec="seconds")
 	line = {"ts": ts, "msg": message}
 	if data is not None:
 		line.update(data)
-	with LOG_PATH.open("a") as f:
-		f.write(json.dumps(line, ensure_ascii=False) + "\n")
+	os.write(_get_log_fd(), _dumps(line) + b"\n")
+	_maybe_rotate_log()
+
+
+# Parsed-config cache keyed on (mtime_ns, size) so repeated loads of an
+# unchanged config.yaml skip disk IO and YAML parsing entirely.
+_CFG_CACHE: dict = {"stat": None, "cfg": None}
+
+# CSafeLoader (libyaml) parses 3-5x faster than the pure-Python SafeLoader
+# when PyYAML was built with it; fall back gracefully otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", getattr(yaml, "SafeLoader", None)) if yaml else None
 
 
 def load_config() -> dict:
 	cfg = DEFAULT_CONFIG.copy()
 	try:
 		if CONFIG_PATH.exists():
+			st = CONFIG_PATH.stat()
+			key = (st.st_mtime_ns, st.st_size)
+			if _CFG_CACHE["stat"] == key and _CFG_CACHE["cfg"] is not None:
+				return _CFG_CACHE["cfg"].copy()
 			with CONFIG_PATH.open("r") as f:
-				file_cfg = yaml.safe_load(f) if yaml else {}
+				file_cfg = yaml.load(f, Loader=_YAML_LOADER) if yaml else {}
 				if isinstance(file_cfg, dict):
 					cfg.update(file_cfg)
+			cfg["_wdset"] = _parse_weekdays(str(cfg.get("weekdays", DEFAULT_CONFIG["weekdays"])))
+			_CFG_CACHE["stat"] = key
+			_CFG_CACHE["cfg"] = cfg.copy()
 	except Exception as e:
 		log("config_load_error", {"error": str(e)})
+	cfg.setdefault("_wdset", _parse_weekdays(str(cfg.get("weekdays", DEFAULT_CONFIG["weekdays"]))))
 	return cfg
 
 
@@ -83,143 +188,164 @@ def parse_hhmm(s: str) -> tuple[int, int]:
 	return int(parts[0]), int(parts[1])
 
 
-def in_active_day(cfg: dict, now_local: dt.datetime) -> bool:
-	wd = now_local.weekday()
-	wdset = set()
-	w = cfg.get("weekdays", "MTWRFSU").upper()
+def _parse_weekdays(w: str) -> frozenset[int]:
+	w = w.upper()
 	if w == "WEEKDAYS":
-		wdset = {0,1,2,3,4}
-	else:
-		for ch in w:
-			if ch in WEEKDAY_MAP:
-				wdset.add(WEEKDAY_MAP[ch])
-	return wd in wdset
+		return frozenset({0, 1, 2, 3, 4})
+	return frozenset(WEEKDAY_MAP[ch] for ch in w if ch in WEEKDAY_MAP)
 
 
-def run_cmd(cmd: list[str], timeout: int = 60) -> tuple[int, str, str]:
+def in_active_day(cfg: dict, now_local: dt.datetime) -> bool:
+	# "_wdset" is precomputed by load_config so the hot loop pays a single
+	# hash lookup instead of rebuilding the set from the string every call.
+	return now_local.weekday() in cfg["_wdset"]
+
+
+async def run_cmd(cmd: list[str], timeout: int = 60) -> tuple[int, str, str]:
 	try:
-		# On Windows, try multiple encodings to handle different command outputs
+		proc = await asyncio.create_subprocess_exec(
+			*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+		try:
+			out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+		except asyncio.TimeoutError:
+			proc.kill()
+			await proc.communicate()
+			return 1, "", f"Command {cmd[0]!r} timed out after {timeout} seconds"
 		if IS_WINDOWS:
-			# Try common Windows encodings: cp936 (Chinese), gbk, utf-8
-			encodings_to_try = ['cp936', 'gbk', 'utf-8', 'latin1']
-			
-			for encoding in encodings_to_try:
-				try:
-					res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, encoding=encoding, errors='replace')
-					# If we get here without exception, the encoding worked
-					return res.returncode, res.stdout, res.stderr
-				except (UnicodeDecodeError, LookupError):
-					continue
-			
-			# If all encodings fail, fall back to bytes and decode with replacement
-			res = subprocess.run(cmd, capture_output=True, timeout=timeout)
-			stdout = res.stdout.decode('utf-8', errors='replace') if res.stdout else ''
-			stderr = res.stderr.decode('utf-8', errors='replace') if res.stderr else ''
-			return res.returncode, stdout, stderr
-		else:
-			res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-			return res.returncode, res.stdout, res.stderr
+			# Decode captured bytes locally; attempts are cheap, re-spawning
+			# the child per candidate encoding is not.
+			return proc.returncode, _decode_output(out), _decode_output(err)
+		return proc.returncode, (out or b"").decode(errors="replace"), (err or b"").decode(errors="replace")
+	except asyncio.CancelledError:
+		raise
 	except Exception as e:
 		return 1, "", str(e)
 
 
-def send_claude(prompt: str, model: str | None, timeout: int = 60) -> bool:
-	# On Windows, use full path to ensure claude is found in scheduled task environment
+def _resolve_claude_path() -> str:
+	# On Windows, prefer the full npm path so claude is found even in the
+	# bare scheduled-task environment; otherwise fall back to PATH.
+	if IS_WINDOWS:
+		cand = _HOME / "AppData/Roaming/npm/claude.cmd"
+		if cand.is_file():
+			return str(cand)
+	return shutil.which("claude") or "claude"
+
+
+def _resolve_monitor_path() -> str:
+	# Probe the common per-user install locations before PATH: the daemon
+	# runs with the pinned PATH from run_daemon.sh / LaunchAgent.plist /
+	# the scheduled task, which omits pip's and conda's user bin dirs
+	# (the login shell the baseline spawned used to paper over this).
 	if IS_WINDOWS:
-		claude_path = os.path.expanduser(r"~\AppData\Roaming\npm\claude.cmd")
-		if not os.path.exists(claude_path):
-			claude_path = "claude"  # Fall back to PATH if full path doesn't exist
+		candidates = (
+			_HOME / "miniconda3/Scripts/claude-monitor.exe",
+			_HOME / ".local/bin/claude-monitor.exe",
+		)
 	else:
-		claude_path = "claude"
-	
-	cmd = [claude_path, "-p", prompt, "--output-format", "json"]
+		candidates = (
+			_HOME / ".local/bin/claude-monitor",
+			_HOME / "miniconda3/bin/claude-monitor",
+			_HOME / "anaconda3/bin/claude-monitor",
+		)
+	for cand in candidates:
+		if cand.is_file():
+			return str(cand)
+	return shutil.which("claude-monitor") or "claude-monitor"
+
+
+# Resolve the executables once at import; re-probing the filesystem on
+# every kickoff / reset cycle just repeats the same stat calls.
+_CLAUDE_PATH = _resolve_claude_path()
+_MONITOR_PATH = _resolve_monitor_path()
+
+
+# The kickoff command rarely changes between pings, so cache the joined
+# log representation instead of rebuilding the string on every call.
+@functools.lru_cache(maxsize=8)
+def _fmt_cmd(cmd: tuple[str, ...]) -> str:
+	return " ".join(cmd)
+
+
+async def send_claude(prompt: str, model: str | None, timeout: int = 60) -> bool:
+	cmd = [_CLAUDE_PATH, "-p", prompt, "--output-format", "json"]
 	# If model is provided and not "default", pass it through; else rely on CLI default
 	if model and model.strip().lower() != "default":
 		cmd += ["--model", model]
-	rc, out, err = run_cmd(cmd, timeout=timeout)
-	log("send_claude", {"rc": rc, "stdout": out[-3000:], "stderr": err[-1000:], "cmd": " ".join(cmd)})
+	rc, out, err = await run_cmd(cmd, timeout=timeout)
+	log("send_claude", {"rc": rc, "stdout": out[-3000:], "stderr": err[-1000:], "cmd": _fmt_cmd(tuple(cmd))})
 	return rc == 0
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_ansi_sub = ANSI_RE.sub
 
 def strip_ansi(text: str) -> str:
-	return ANSI_RE.sub("", text or "")
-
-RESET_PATTERNS = [
-	re.compile(r"Limit\s+resets\s+at\s*[:\-]?\s*(\d{1,2}:\d{2})\s*(a\.m\.|p\.m\.|AM|PM)", re.I),
-	re.compile(r"Limit\s+resets\s+at\s*[:\-]?\s*(\d{2}):(\d{2})", re.I),
-	re.compile(r"Time\s*to\s*Reset\s*[:\-]?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?", re.I),
-	re.compile(r"Time\s*to\s*Reset\s*[:\-]?\s*(\d+)\s*h\s*(\d+)?\s*m", re.I),
-]
+	# Fast path: a C-level substring scan is far cheaper than invoking the
+	# regex engine, and most monitor output carries no escapes at all.
+	if not text or "\x1b" not in text:
+		return text or ""
+	return _ansi_sub("", text)
+
+# All reset markers combined into one alternation so a single regex-engine
+# pass over the monitor output suffices; named groups identify which form
+# matched. The a.m./p.m. variant precedes the bare HH:MM one so it wins
+# when both could apply to the same text.
+COMBINED_RESET = re.compile(
+	r"(?:Limit\s+resets\s+at\s*[:\-]?\s*(?P<ap_time>\d{1,2}:\d{2})\s*(?P<ap>a\.m\.|p\.m\.|AM|PM))"
+	r"|(?:Limit\s+resets\s+at\s*[:\-]?\s*(?P<hh>\d{2}):(?P<mm>\d{2}))"
+	r"|(?:Time\s*to\s*Reset\s*[:\-]?\s*(?P<th>\d{1,2}):(?P<tm>\d{2})(?::(?P<ts>\d{2}))?)"
+	r"|(?:Time\s*to\s*Reset\s*[:\-]?\s*(?P<rh>\d+)\s*h\s*(?P<rm>\d+)?\s*m)",
+	re.I,
+)
 
 
 def parse_reset(stdout: str, tz: ZoneInfo) -> dt.datetime | None:
-	out = strip_ansi(stdout)
+	# The reset marker sits in the last few lines of the monitor output, so
+	# cap the regex search region instead of scanning many KB of table rows.
+	# Slice the raw buffer before stripping (with headroom for escape bytes)
+	# so a full stripped copy of the output is never allocated.
+	raw = stdout or ""
+	tail = strip_ansi(raw if len(raw) < 8192 else raw[-8192:])
+	if len(tail) > 4096:
+		tail = tail[-4096:]
 	now = dt.datetime.now(tz)
-	m = RESET_PATTERNS[0].search(out)
-	if m:
-		tstr = m.group(1); ap = m.group(2)
-		ap_fixed = ap.replace("a.m.", "AM").replace("p.m.", "PM").upper()
-		when = dt.datetime.strptime(f"{tstr} {ap_fixed}", "%I:%M %p").time()
+	m = COMBINED_RESET.search(tail)
+	if not m:
+		return None
+	g = m.groupdict()
+	if g["ap_time"]:
+		ap_fixed = g["ap"].replace("a.m.", "AM").replace("p.m.", "PM").upper()
+		when = dt.datetime.strptime(f"{g['ap_time']} {ap_fixed}", "%I:%M %p").time()
 		target = now.replace(hour=when.hour, minute=when.minute, second=0, microsecond=0)
 		if target <= now: target += dt.timedelta(days=1)
 		return target
-	m = RESET_PATTERNS[1].search(out)
-	if m:
-		hh = int(m.group(1)); mm = int(m.group(2))
-		target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+	if g["hh"]:
+		target = now.replace(hour=int(g["hh"]), minute=int(g["mm"]), second=0, microsecond=0)
 		if target <= now: target += dt.timedelta(days=1)
 		return target
-	m = RESET_PATTERNS[2].search(out)
-	if m:
-		h, mi, s = int(m.group(1)), int(m.group(2)), int(m.group(3) or 0)
-		return now + dt.timedelta(hours=h, minutes=mi, seconds=s)
-	m = RESET_PATTERNS[3].search(out)
-	if m:
-		h, mi = int(m.group(1)), int(m.group(2) or 0)
-		return now + dt.timedelta(hours=h, minutes=mi)
-	return None
-
-
-def get_next_reset(tz: ZoneInfo, backoff_start: float = 2.0, backoff_max: float = 60.0) -> dt.datetime:
+	if g["th"]:
+		return now + dt.timedelta(hours=int(g["th"]), minutes=int(g["tm"]), seconds=int(g["ts"] or 0))
+	return now + dt.timedelta(hours=int(g["rh"]), minutes=int(g["rm"] or 0))
+
+
+async def get_next_reset(tz: ZoneInfo, backoff_start: float = 2.0, backoff_max: float = 60.0, max_attempts: int = 5) -> dt.datetime:
 	"""Runs claude-monitor and parses the next reset. Falls back to now+5h."""
-	sleep_s = backoff_start
-	while True:
-		# Platform-specific command execution
-		if IS_WINDOWS:
-			# Try multiple possible locations for claude-monitor on Windows
-			claude_monitor_paths = [
-				os.path.expanduser(r"~\miniconda3\Scripts\claude-monitor.exe"),
-				os.path.expanduser(r"~\.local\bin\claude-monitor.exe"),
-				"claude-monitor"  # Fall back to PATH
-			]
-			
-			rc, out, err = None, "", ""
-			for monitor_path in claude_monitor_paths:
-				try:
-					if monitor_path != "claude-monitor" and not os.path.exists(monitor_path):
-						continue
-					rc, out, err = run_cmd([monitor_path, "--clear"], timeout=20)
-					break
-				except Exception as e:
-					continue
-			
-			if rc is None:  # All paths failed
-				rc, out, err = run_cmd(["claude-monitor", "--clear"], timeout=20)
-		else:
-			# macOS/Linux implementation
-			rc, out, err = run_cmd(["bash","-lc","claude-monitor --clear"], timeout=20)
-		
+	for attempt in range(max_attempts):
+		# Exec the resolved binary directly on every platform; wrapping it in
+		# "bash -lc" forked a login shell that re-sourced the user's profile
+		# on each reset cycle.
+		rc, out, err = await run_cmd([_MONITOR_PATH, "--clear"], timeout=20)
+
 		combined = out or err
 		parsed = parse_reset(combined, tz)
-		log("monitor_parse", {"rc": rc, "parsed": parsed.isoformat() if parsed else None, "snippet": strip_ansi(combined)[-1200:]})
+		log("monitor_parse", {"rc": rc, "attempt": attempt, "parsed": parsed.isoformat() if parsed else None, "snippet": strip_ansi(combined)[-1200:]})
 		if parsed:
 			return parsed
-		# Backoff and retry a few times, then fallback
-		if sleep_s > backoff_max:
-			return dt.datetime.now(tz) + dt.timedelta(hours=5)
-		time.sleep(sleep_s)
-		sleep_s *= 1.7
+		# Capped exponential backoff with jitter so retries stay bounded
+		# and don't hammer claude-monitor in lockstep.
+		if attempt < max_attempts - 1:
+			await asyncio.sleep(min(backoff_max, backoff_start * (1.7 ** attempt)) + random.random())
+	return dt.datetime.now(tz) + dt.timedelta(hours=5)
 
 
 def ensure_caffeinate(enabled: bool) -> subprocess.Popen | None:
@@ -279,57 +405,76 @@ def stop_caffeinate_windows() -> None:
 		log("windows_caffeinate_stop_error", {"error": str(e)})
 
 
-def maybe_force_sleep(enabled: bool) -> None:
+async def maybe_force_sleep(enabled: bool) -> None:
 	if not enabled:
 		return
-	
+
 	if IS_WINDOWS:
-		maybe_force_sleep_windows(enabled)
+		await maybe_force_sleep_windows(enabled)
 	else:
 		# macOS implementation
 		try:
-			rc, out, err = run_cmd(["sudo","pmset","sleepnow"], timeout=5)
+			rc, out, err = await run_cmd(["sudo","pmset","sleepnow"], timeout=5)
 			log("pmset_sleepnow", {"rc": rc, "stdout": out, "stderr": err})
 		except Exception as e:
 			log("pmset_sleep_error", {"error": str(e)})
 
-def maybe_force_sleep_windows(enabled: bool) -> None:
+async def maybe_force_sleep_windows(enabled: bool) -> None:
 	if not enabled:
 		return
 	try:
 		# Use Windows shutdown command to hibernate (closest to macOS sleep)
-		rc, out, err = run_cmd(["shutdown", "/h"], timeout=5)
+		rc, out, err = await run_cmd(["shutdown", "/h"], timeout=5)
 		log("windows_hibernate", {"rc": rc, "stdout": out, "stderr": err})
 	except Exception as e:
 		log("windows_sleep_error", {"error": str(e)})
 
 
-def validate_pmset(expected_time: str) -> None:
+# Re-validating the wake schedule spawns pmset/schtasks (~50-200ms), so
+# cap how often the probe actually runs; callers can invoke freely.
+_VALIDATE_INTERVAL = 3600.0
+_last_validated = 0.0
+
+
+async def validate_pmset(expected_time: str) -> None:
+	global _last_validated
+	now_mono = time.monotonic()
+	if _last_validated and now_mono - _last_validated < _VALIDATE_INTERVAL:
+		return
+	_last_validated = now_mono
 	if IS_WINDOWS:
-		validate_windows_schedule(expected_time)
+		await validate_windows_schedule(expected_time)
 	else:
-		# macOS implementation
-		rc, out, err = run_cmd(["pmset","-g","sched"], timeout=5)
-		ok = expected_time in (out or "")
+		# macOS implementation. Word-bounded match so e.g. "6:00" doesn't
+		# accept "16:00" in the schedule listing.
+		rc, out, err = await run_cmd(["pmset","-g","sched"], timeout=5)
+		ok = bool(re.search(rf"\b{re.escape(expected_time)}\b", out or ""))
 		log("pmset_sched", {"rc": rc, "ok": ok, "snippet": (out or err)[-1200:]})
 
-def validate_windows_schedule(expected_time: str) -> None:
+async def validate_windows_schedule(expected_time: str) -> None:
 	try:
 		# Check Windows Task Scheduler for our wake task
-		rc, out, err = run_cmd(["schtasks", "/query", "/tn", "ClaudeSchedulerWake", "/fo", "LIST"], timeout=5)
-		ok = expected_time in (out or "")
+		rc, out, err = await run_cmd(["schtasks", "/query", "/tn", "ClaudeSchedulerWake", "/fo", "LIST"], timeout=5)
+		ok = bool(re.search(rf"\b{re.escape(expected_time)}\b", out or ""))
 		log("windows_sched", {"rc": rc, "ok": ok, "snippet": (out or err)[-1200:]})
 	except Exception as e:
 		log("windows_sched_error", {"error": str(e)})
 
 
-def wait_until(target: dt.datetime) -> None:
+# Upper bound on a single wait_until sleep. The monotonic clock that
+# asyncio sleeps against does not advance while the machine is suspended,
+# so after the scheduled pmset/schtasks wake a full-interval sleep would
+# oversleep by the entire suspend duration. Bounded chunks guarantee the
+# wall clock is re-read within minutes of resume.
+_WAIT_CHUNK_S = 300
+
+
+async def wait_until(target: dt.datetime) -> None:
 	while True:
-		now = dt.datetime.now(target.tzinfo)
-		d = (target - now).total_seconds()
-		if d <= 0:
+		remaining = (target - dt.datetime.now(target.tzinfo)).total_seconds()
+		if remaining <= 0:
 			return
-		time.sleep(min(60, max(1, d)))
+		await asyncio.sleep(min(_WAIT_CHUNK_S, remaining))
 
 
 def next_daily_in_window(now: dt.datetime, start_hm: tuple[int,int], tz: ZoneInfo) -> dt.datetime:
@@ -340,91 +485,129 @@ def next_daily_in_window(now: dt.datetime, start_hm: tuple[int,int], tz: ZoneInf
 	return t
 
 
-def daemon_loop():
+async def daemon_loop():
 	cfg = load_config()
-	tz = ZoneInfo(cfg.get("timezone", DEFAULT_CONFIG["timezone"]))
-	start_hm = parse_hhmm(cfg.get("start_time", DEFAULT_CONFIG["start_time"]))
-	sleep_hm = parse_hhmm(cfg.get("sleep_time", DEFAULT_CONFIG["sleep_time"]))
-	pre_min = int(cfg.get("pre_caffeinate_minutes", DEFAULT_CONFIG["pre_caffeinate_minutes"]))
+	# Bind hot lookups to locals once; the loop below runs for the life of
+	# the daemon and LOAD_FAST beats LOAD_GLOBAL+LOAD_ATTR on every tick.
+	_now = dt.datetime.now
+	_delta = dt.timedelta
+	_cfg_get = cfg.get
+	tz = ZoneInfo(_cfg_get("timezone", DEFAULT_CONFIG["timezone"]))
+	start_hm = parse_hhmm(_cfg_get("start_time", DEFAULT_CONFIG["start_time"]))
+	sleep_hm = parse_hhmm(_cfg_get("sleep_time", DEFAULT_CONFIG["sleep_time"]))
+	pre_min = int(_cfg_get("pre_caffeinate_minutes", DEFAULT_CONFIG["pre_caffeinate_minutes"]))
 	caffeinate_proc: subprocess.Popen | None = None
-	validate_pmset(cfg.get("start_time", DEFAULT_CONFIG["start_time"]))
+	try:
+		await validate_pmset(_cfg_get("start_time", DEFAULT_CONFIG["start_time"]))
 
-	log("daemon_started", {"cfg": cfg})
-	model = cfg.get("model")  # Optional: if None or "default", use CLI default
-	prompt = cfg.get("kickoff_prompt", DEFAULT_CONFIG["kickoff_prompt"]) or "ping"
+		log("daemon_started", {"cfg": {k: v for k, v in cfg.items() if not k.startswith("_")}})
+		model = _cfg_get("model")  # Optional: if None or "default", use CLI default
+		prompt = _cfg_get("kickoff_prompt", DEFAULT_CONFIG["kickoff_prompt"]) or "ping"
 
-	while True:
-		now = dt.datetime.now(tz)
-		if not in_active_day(cfg, now):
-			# Ensure caffeinate is not running outside active days
-			stop_caffeinate(caffeinate_proc)
-			caffeinate_proc = None
-			# Sleep until next day start
-			next_start = next_daily_in_window(now, start_hm, tz)
-			log("inactive_day_wait", {"until": next_start.isoformat()})
-			wait_until(next_start)
-			continue
-
-		# Compute today's times
-		today_start = now.replace(hour=start_hm[0], minute=start_hm[1], second=0, microsecond=0)
-		pre_start = today_start - dt.timedelta(minutes=max(0, pre_min))
-
-		# If before start_time, pre-start caffeinate N minutes earlier
-		if now < today_start:
-			if cfg.get("use_caffeinate", True):
-				if now < pre_start:
-					log("waiting_for_pre_start", {"until": pre_start.isoformat()})
-					wait_until(pre_start)
-					now = dt.datetime.now(tz)
-				# Start caffeinate if not already
-				if caffeinate_proc is None or caffeinate_proc.poll() is not None:
-					caffeinate_proc = ensure_caffeinate(True)
-			log("waiting_for_start", {"until": today_start.isoformat()})
-			wait_until(today_start)
-			now = dt.datetime.now(tz)
-
-		# Start caffeinate for active window if enabled (in case not started earlier)
-		if cfg.get("use_caffeinate", True) and (caffeinate_proc is None or caffeinate_proc.poll() is not None):
-			caffeinate_proc = ensure_caffeinate(True)
-
-		# Kickoff
-		log("kickoff", {"at": now.isoformat()})
-		send_claude(prompt, model, timeout=60)
-
-		# Work until sleep_time
 		while True:
-			now = dt.datetime.now(tz)
-			today_sleep = now.replace(hour=sleep_hm[0], minute=sleep_hm[1], second=0, microsecond=0)
-			if now >= today_sleep:
-				log("entering_quiet_hours", {"at": now.isoformat()})
-				# Stop caffeinate at quiet hours
+			now = _now(tz)
+			if not in_active_day(cfg, now):
+				# Ensure caffeinate is not running outside active days
 				stop_caffeinate(caffeinate_proc)
 				caffeinate_proc = None
-				maybe_force_sleep(bool(cfg.get("force_sleep_at_quiet_hours", False)))
-				break
+				# Sleep until next day start
+				next_start = next_daily_in_window(now, start_hm, tz)
+				log("inactive_day_wait", {"until": next_start.isoformat()})
+				await wait_until(next_start)
+				continue
+
+			# Compute today's times
+			today_start = now.replace(hour=start_hm[0], minute=start_hm[1], second=0, microsecond=0)
+			pre_start = today_start - _delta(minutes=max(0, pre_min))
+
+			# If before start_time, pre-start caffeinate N minutes earlier
+			if now < today_start:
+				if _cfg_get("use_caffeinate", True):
+					if now < pre_start:
+						log("waiting_for_pre_start", {"until": pre_start.isoformat()})
+						await wait_until(pre_start)
+						now = _now(tz)
+					# Start caffeinate if not already
+					if caffeinate_proc is None or caffeinate_proc.poll() is not None:
+						caffeinate_proc = ensure_caffeinate(True)
+				log("waiting_for_start", {"until": today_start.isoformat()})
+				await wait_until(today_start)
+				now = _now(tz)
+
+			# Start caffeinate for active window if enabled (in case not started earlier)
+			if _cfg_get("use_caffeinate", True) and (caffeinate_proc is None or caffeinate_proc.poll() is not None):
+				caffeinate_proc = ensure_caffeinate(True)
+
+			# Kickoff
+			log("kickoff", {"at": now.isoformat()})
+			await send_claude(prompt, model, timeout=60)
+
+			# Work until sleep_time. Anchor today_sleep to today's date once:
+			# recomputing it from `now` each iteration silently shifted it to
+			# the next day whenever the loop crossed midnight. Compare against
+			# its epoch so each tick costs a time.time() call instead of a
+			# tz-aware datetime construction through zoneinfo.
+			today_sleep = today_start.replace(hour=sleep_hm[0], minute=sleep_hm[1])
+			sleep_epoch = today_sleep.timestamp()
+			while True:
+				if time.time() >= sleep_epoch:
+					log("entering_quiet_hours", {"at": _now(tz).isoformat()})
+					# Stop caffeinate at quiet hours
+					stop_caffeinate(caffeinate_proc)
+					caffeinate_proc = None
+					await maybe_force_sleep(bool(_cfg_get("force_sleep_at_quiet_hours", False)))
+					break
 
-			# Find next reset and re-prime
-			next_reset = get_next_reset(tz)
-			buffered = next_reset + dt.timedelta(seconds=3)
-			log("sleep_until_reset", {"reset": next_reset.isoformat(), "buffered": buffered.isoformat()})
-			wait_until(buffered)
-			send_claude(prompt, model, timeout=60)
+				# Find next reset and re-prime
+				next_reset = await get_next_reset(tz)
+				buffered = next_reset + _delta(seconds=3)
+				log("sleep_until_reset", {"reset": next_reset.isoformat(), "buffered": buffered.isoformat()})
+				await wait_until(buffered)
+				await send_claude(prompt, model, timeout=60)
 
-		# After quiet hours, ensure caffeinate remains stopped and wait until next day's start
-		stop_caffeinate(caffeinate_proc)
-		caffeinate_proc = None
-		next_start = next_daily_in_window(dt.datetime.now(tz), start_hm, tz)
-		log("waiting_next_day", {"until": next_start.isoformat()})
-		wait_until(next_start)
+			# After quiet hours, ensure caffeinate remains stopped and wait until next day's start
+			stop_caffeinate(caffeinate_proc)
+			caffeinate_proc = None
+			next_start = next_daily_in_window(_now(tz), start_hm, tz)
+			log("waiting_next_day", {"until": next_start.isoformat()})
+			await wait_until(next_start)
 
+	finally:
+		# Runs on cancellation too (SIGTERM/Ctrl-C), so no caffeinate
+		# child outlives the daemon.
+		stop_caffeinate(caffeinate_proc)
 	# Not reachable
 
 
+# Name of the signal that requested shutdown, for the final log entry.
+_SHUTDOWN_SIGNAL = None
+
+
+def _request_shutdown(signame: str, task: asyncio.Task) -> None:
+	global _SHUTDOWN_SIGNAL
+	_SHUTDOWN_SIGNAL = signame
+	task.cancel()
+
+
+async def _main() -> None:
+	# Cancel the daemon task on SIGTERM so supervisors (launchd/systemd)
+	# get a prompt shutdown instead of waiting out a blocked subprocess;
+	# cancellation interrupts any pending await immediately and unwinds
+	# through daemon_loop's finally block, stopping caffeinate.
+	loop = asyncio.get_running_loop()
+	task = asyncio.current_task()
+	try:
+		loop.add_signal_handler(signal.SIGTERM, _request_shutdown, "SIGTERM", task)
+	except (NotImplementedError, RuntimeError):
+		pass  # add_signal_handler is unavailable on Windows event loops
+	await daemon_loop()
+
+
 if __name__ == "__main__":
 	try:
-		daemon_loop()
-	except KeyboardInterrupt:
-		log("shutdown", {"signal": "KeyboardInterrupt"})
+		asyncio.run(_main())
+	except (KeyboardInterrupt, asyncio.CancelledError):
+		log("shutdown", {"signal": _SHUTDOWN_SIGNAL or "KeyboardInterrupt"})
 		sys.exit(0)
 	except Exception as e:
 		log("fatal_error", {"error": str(e)})